@@ -14,10 +14,11 @@ On the ISIR cluster, numpy and pandas are not installed in the barebone cluster
 import argparse
 import os
 import platform
-import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
 
 # ---------------------------------------------------------------------------
@@ -33,6 +34,11 @@ try:
 except ImportError:      # pragma: no cover
     pd = None
 
+try:
+    import psutil
+except ImportError:      # pragma: no cover
+    psutil = None
+
 PYARROW_AVAILABLE = False
 if pd is not None:
     try:
@@ -41,16 +47,26 @@ if pd is not None:
     except ImportError:  # pragma: no cover
         pass
 
+_RNG = np.random.default_rng() if np is not None else None
+
 START = time.time()
-TARGET_SECONDS = 20          # ≈ 3 minutes
+TARGET_SECONDS = 0           # no idle padding unless --pad-seconds is given
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def parse_cli() -> str:
-    """Return the run-name supplied on the command line (or a default)."""
+def non_negative_int(value: str) -> int:
+    """argparse type: an integer >= 0."""
+    n = int(value)
+    if n < 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0, got {n}")
+    return n
+
+
+def parse_cli() -> argparse.Namespace:
+    """Return the parsed command line (run-name falls back to a default)."""
     parser = argparse.ArgumentParser(
         description="SLURM probe – requires a run-name/ID for output files."
     )
@@ -60,11 +76,19 @@ def parse_cli() -> str:
         default=None,
         help="Run identifier (e.g. $SLURM_JOB_ID); added to results filenames.",
     )
+    parser.add_argument(
+        "--pad-seconds",
+        type=non_negative_int,
+        default=TARGET_SECONDS,
+        help="Idle until this wall-clock duration is reached (default: no idling).",
+    )
     args = parser.parse_args()
     # Fallback if nothing was given on the CLI
-    return args.run_name or os.getenv("SLURM_JOB_ID", "local")
+    args.run_name = args.run_name or os.getenv("SLURM_JOB_ID", "local")
+    return args
 
 
+@lru_cache(maxsize=1)
 def cpu_count():
     slurm_cores = (
         os.getenv("SLURM_CPUS_ON_NODE")
@@ -74,35 +98,56 @@ def cpu_count():
     return int(slurm_cores) if slurm_cores else os.cpu_count()
 
 
+@lru_cache(maxsize=1)
 def total_memory_gib():
+    if psutil is not None:
+        return psutil.virtual_memory().total / 2**30
+    fd = os.open("/proc/meminfo", os.O_RDONLY)
     try:
-        import psutil
+        buf = os.read(fd, 4096).decode()
+    finally:
+        os.close(fd)
+    _, found, rest = buf.partition("MemTotal:")
+    if not found:
+        return None
+    kib = int(rest.split(None, 1)[0])  # KiB
+    return kib / 2**20
 
-        return psutil.virtual_memory().total / 2**30
-    except ImportError:
-        with open("/proc/meminfo") as fh:
-            for line in fh:
-                if line.startswith("MemTotal:"):
-                    kib = int(line.split()[1])  # KiB
-                    return kib / 2**20
-    return None
+
+@lru_cache(maxsize=1)
+def _installed_packages():
+    from importlib.metadata import distributions
+
+    rows = []
+    for d in distributions():
+        md = d.metadata  # parsed on every access: read it once
+        name, ver = md["Name"], md["Version"]
+        if name:  # skip broken/partial installs
+            rows.append((name, ver))
+    return tuple(sorted(rows, key=lambda r: r[0].lower()))
 
 
 def pip_list():
     try:
-        return subprocess.check_output(["pip3", "list", "--format=columns"], text=True)
+        rows = _installed_packages()
+        return "\n".join(f"{n:<40} {v}" for n, v in rows)
     except Exception as exc:
-        return f"(pip3 list failed: {exc})"
+        return f"(listing failed: {exc})"
 
 
+@lru_cache(maxsize=1)
 def read_issue():
-    p = Path("/etc/issue")
-    if p.is_file():
+    try:
+        fd = os.open("/etc/issue", os.O_RDONLY)
         try:
-            return p.read_text(errors="replace").strip()
-        except Exception as exc:
-            return f"(Could not read /etc/issue: {exc})"
-    return "(No /etc/issue found on this system)"
+            data = os.read(fd, 4096)
+        finally:
+            os.close(fd)
+    except FileNotFoundError:
+        return "(No /etc/issue found on this system)"
+    except OSError as exc:
+        return f"(Could not read /etc/issue: {exc})"
+    return data.decode("utf-8", errors="replace").strip()
 
 
 # ---------------------------------------------------------------------------
@@ -113,16 +158,15 @@ def generate_dataframe():
     if np is None or pd is None:
         print("# DataFrame generation skipped – numpy and/or pandas not installed.")
         return None
-    return pd.DataFrame(
-        {"metric1": np.random.random(100), "metric2": np.random.random(100)}
-    )
+    arr = _RNG.random((100, 2))
+    return pd.DataFrame({"metric1": arr[:, 0], "metric2": arr[:, 1]})
 
 
 def save_dataframe(df: "pd.DataFrame", outdir: Path, run_name: str):
     suffix = ".feather" if PYARROW_AVAILABLE else ".csv"
     fpath = outdir / f"probe_results_{run_name}{suffix}"
     if PYARROW_AVAILABLE:
-        df.to_feather(fpath)
+        df.to_feather(fpath, compression="lz4", compression_level=None, version=2)
     else:
         df.to_csv(fpath, index=False)
     print(f"Saved DataFrame to {fpath.resolve()}")
@@ -133,14 +177,22 @@ def save_dataframe(df: "pd.DataFrame", outdir: Path, run_name: str):
 # ---------------------------------------------------------------------------
 
 def main():
-    run_name = parse_cli()
+    args = parse_cli()
+    run_name = args.run_name
 
     print("# SLURM environment probe\n")
     print(f"Run identifier            : {run_name}\n")
 
+    # The I/O-bound probes are independent: run them concurrently and print
+    # their results in the usual order below.
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        fut_mem = ex.submit(total_memory_gib)
+        fut_issue = ex.submit(read_issue)
+        fut_pip = ex.submit(pip_list)
+
     # CPU + memory ----------------------------------------------------------
     print(f"Allocated CPU cores        : {cpu_count()}")
-    mem_gib = total_memory_gib()
+    mem_gib = fut_mem.result()
     print(f"Total visible memory       : {mem_gib:.2f} GiB\n")
 
     # Python version --------------------------------------------------------
@@ -152,12 +204,12 @@ def main():
 
     # /etc/issue ------------------------------------------------------------
     print("# /etc/issue contents\n")
-    print(read_issue())
+    print(fut_issue.result())
     print()
 
     # Packages --------------------------------------------------------------
-    print("# Python packages (pip3 list)\n")
-    print(pip_list())
+    print("# Python packages (importlib.metadata)\n")
+    print(fut_pip.result())
 
     # Optional DataFrame ----------------------------------------------------
     df = generate_dataframe()
@@ -166,13 +218,12 @@ def main():
         results_dir.mkdir(exist_ok=True)
         save_dataframe(df, results_dir, run_name)
 
-    # Idle to reach ~3 min --------------------------------------------------
-    elapsed = time.time() - START
-    remaining = TARGET_SECONDS - elapsed
+    # Optional idling (accounting tests) ------------------------------------
+    remaining = args.pad_seconds - (time.time() - START)
     if remaining > 0:
         print(
             f"\nIdling for {timedelta(seconds=int(remaining))} "
-            "to reach ≈3 minutes wall-clock…"
+            f"to reach ≈{args.pad_seconds} s wall-clock…"
         )
         time.sleep(remaining)
 